@@ -21,15 +21,22 @@ Usage:
 """
 
 import json
+import math
 import os
 import logging
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from uuid import UUID
 from datetime import date
 
 from dateutil import parser
+import numpy as np
 import pandas as pd
-from typing import Optional, Literal
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import List, Optional, Literal
 
 from pydantic import (
     BaseModel,
@@ -40,8 +47,22 @@ from pydantic import (
     ValidationError,
     Field,
     condecimal,
+    TypeAdapter,
 )
 
+# Loose shape check applied to a whole email column before Pydantic runs
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+# Weights made of a single number followed by a single unit, e.g. "1.5 kg"
+WEIGHT_RE = re.compile(r"^(\d+\.?\d*)\s*(kg|g|ml|oz)$")
+WEIGHT_FACTORS = {"kg": 1000, "g": 1, "ml": 1, "oz": 28.3495}  # Units to grams
+# Patterns used inside the field validators, compiled once at import time
+PHONE_DIAL_CODE_RE = re.compile(r"^\+\d{2,3}\(0\)|^001[- ]?")
+PHONE_BRACKET_RE = re.compile(r"^\(0\)|^\(00\)|\(")
+PHONE_AREA_CODE_RE = re.compile(r"^\d{2,3}")
+EXPIRY_RE = re.compile(r"^(0[1-9]|1[0-2])\/([0-9]{2})$")
+NON_DIGIT_RE = re.compile(r"\D")
+NON_NUMERIC_RE = re.compile(r"[^0-9.]")
+
 
 class UserModel(BaseModel):
     """
@@ -111,10 +132,10 @@ class UserModel(BaseModel):
         - str: The cleaned phone number.
         """
         if isinstance(value, str):
-            value = re.sub(r"^\+\d{2,3}\(0\)|^001[- ]?", "", value)
-            value = re.sub(r"^\(0\)|^\(00\)|\(", "", value)
-            value = re.sub(r"\)", "", value)
-            value = re.sub(r"^\d{2,3}", "", value)
+            value = PHONE_DIAL_CODE_RE.sub("", value)
+            value = PHONE_BRACKET_RE.sub("", value)
+            value = value.replace(")", "")
+            value = PHONE_AREA_CODE_RE.sub("", value)
             value = (
                 value.replace("-", ", ")
                 .replace(".", ", ")
@@ -191,7 +212,7 @@ class PaymentModel(BaseModel):
         Returns:
         - str: The validated expiry date if the format is correct, otherwise raises a ValueError.
         """
-        if not re.match(r"^(0[1-9]|1[0-2])\/([0-9]{2})$", value):
+        if not EXPIRY_RE.match(value):
             raise ValueError("Invalid expiry date format. Expected MM/YY.")
         return value
 
@@ -213,7 +234,7 @@ class PaymentModel(BaseModel):
             raise ValueError("Card number must be a string or convertible to a string.")
 
         # Clean the card number by removing non-digit characters
-        return re.sub(r"\D", "", value)
+        return NON_DIGIT_RE.sub("", value)
 
     @field_validator("date_payment_confirmed", mode="before")
     def validate_and_clean_date_payment(cls, value):
@@ -301,6 +322,15 @@ class StoreModel(BaseModel):
         Returns:
         - int: The cleaned and converted staff number as an integer.
         """
+        # Negative counts are rejected rather than having their sign stripped,
+        # whether they arrive as numbers or as strings such as "-5"
+        if isinstance(value, str):
+            negative = value.strip().startswith("-")
+        else:
+            negative = isinstance(value, (int, float)) and value < 0
+        if negative:
+            raise ValueError(f"Invalid staff number: {value}")
+
         # Remove any non-digit characters
         cleaned_value = "".join(filter(str.isdigit, str(value)))
 
@@ -322,11 +352,11 @@ class ProductModel(BaseModel):
 
     Attributes:
         product_name (str): Name of the product.
-        product_price (str): Price of the product.
-        weight (str): Weight of the product.
+        product_price (float): Price of the product.
+        weight (float): Weight of the product in grams.
         category (str): Category of the product.
         EAN (str): European Article Number (EAN) of the product.
-        date_added (str): Date when the product was added.
+        date_added (date): Date when the product was added.
         uuid (str): UUID of the product.
         removed (str): Status indicating whether the product is still available or removed.
         product_code (str): Code of the product.
@@ -341,41 +371,47 @@ class ProductModel(BaseModel):
     """
 
     product_name: str
-    product_price: str
-    weight: str
+    product_price: float
+    weight: float
     category: str
     EAN: str
-    date_added: str
+    date_added: date
     uuid: UUID
     removed: str
     product_code: str
 
-    @field_validator("product_price")
+    @field_validator("product_price", mode="before")
     def validate_product_price(cls, value):
         """
         Validate and clean the product price by removing currency symbols and converting to float.
 
         Args:
-        - value: The product price string.
+        - value: The product price string, or a price already converted to a number.
 
         Returns:
         - float: The cleaned and converted product price as a float.
         """
-        # Remove currency symbol and convert to float
-        if value.startswith("£"):
-            value = value[1:]
-        try:
-            return float(value)
-        except ValueError:
-            raise ValueError("Invalid product price format")
+        if isinstance(value, str):
+            # Remove currency symbol and convert to float
+            value = value.strip()
+            if value.startswith("£"):
+                value = value[1:]
+            try:
+                return float(value)
+            except ValueError:
+                raise ValueError("Invalid product price format")
+        if isinstance(value, float) and math.isnan(value):
+            raise ValueError("Product price is missing")
+        return value
 
-    @field_validator("weight")
+    @field_validator("weight", mode="before")
     def validate_weight(cls, value):
         """
         Validate and convert product weight into grams, handling various units.
 
         Args:
-        - value: The weight string which may contain units like kg, g, ml, or oz.
+        - value: The weight string which may contain units like kg, g, ml, or oz,
+          or a weight already converted to grams.
 
         Returns:
         - float: The converted weight in grams.
@@ -386,20 +422,22 @@ class ProductModel(BaseModel):
             if "ml" in value:
                 # Assuming 1ml = 1g
                 return float(
-                    re.sub("[^0-9.]", "", value)
+                    NON_NUMERIC_RE.sub("", value)
                 )  # Remove non-numeric characters
             elif "kg" in value:
-                return float(re.sub("[^0-9.]", "", value)) * 1000  # Convert kg to g
+                return float(NON_NUMERIC_RE.sub("", value)) * 1000  # Convert kg to g
             elif "g" in value:
-                return float(re.sub("[^0-9.]", "", value))
+                return float(NON_NUMERIC_RE.sub("", value))
             elif "oz" in value:
                 # Convert ounces to grams
-                return float(re.sub("[^0-9.]", "", value)) * 28.3495
+                return float(NON_NUMERIC_RE.sub("", value)) * 28.3495
             else:
                 raise ValueError("Weight must be in kg or g")
+        if isinstance(value, float) and math.isnan(value):
+            raise ValueError("Weight is missing")
         return value
 
-    @field_validator("date_added")
+    @field_validator("date_added", mode="before")
     def validate_date_added(cls, value):
         """
         Convert string dates to date objects for the date_added field.
@@ -428,7 +466,7 @@ class ProductModel(BaseModel):
         Returns:
         - str: The validated EAN if it contains only digits, otherwise raises a ValueError.
         """
-        if not re.match(r"^\d+$", value):
+        if not value.isdecimal():
             raise ValueError("EAN should only contain digits")
         return value
 
@@ -616,6 +654,25 @@ class DateModel(BaseModel):
         str_strip_whitespace = True
 
 
+# Date fields parsed column-at-a-time by DataCleaning before model validation
+DATE_COLUMNS = {
+    UserModel: ("date_of_birth", "join_date"),
+    PaymentModel: ("date_payment_confirmed",),
+    StoreModel: ("opening_date",),
+    ProductModel: ("date_added",),
+}
+# Exact date layouts parsed in bulk; dateutil reads each of them the same way.
+# Anything else, such as "today" or a bare year, is left to the model.
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y %B %d", "%B %Y %d", "%d %B %Y")
+# UUID fields shape-checked column-at-a-time by DataCleaning with pyarrow
+UUID_COLUMNS = {
+    UserModel: ("user_uuid",),
+    ProductModel: ("uuid",),
+    OrderModel: ("date_uuid", "user_uuid"),
+    DateModel: ("date_uuid",),
+}
+
+
 class DataCleaning:
     """
     Class for validating and cleaning data using Pydantic models.
@@ -627,6 +684,8 @@ class DataCleaning:
         invalid_errors (list): List of validation errors encountered during the cleaning process.
         model_class (BaseModel): Pydantic model class used for validation.
         class_name (str): Name of the DataCleaning class instance.
+        batch_size (int): Number of records passed to Pydantic per validation call.
+        n_jobs (int): Number of worker processes used for validation.
 
     Methods:
         _setup_logger(): Sets up a logger for recording validation errors.
@@ -636,22 +695,60 @@ class DataCleaning:
         save_invalid_data_log(log_filename): Saves invalid data along with errors to a CSV log file.
     """
 
-    def __init__(self, model_class=UserModel, class_name="Data_cleaning"):
+    def __init__(
+        self, model_class=UserModel, class_name="Data_cleaning", batch_size=32, n_jobs=1
+    ):
         """
         Initialize the DataCleaning object with a Pydantic model class and class name.
 
         Args:
         - model_class: The Pydantic model class used for validation (default: UserModel).
         - class_name: The name of the class for logging purposes (default: 'Data_cleaning').
+        - batch_size: Number of records validated per call (default: 32).
+        - n_jobs: Number of worker processes validating the records, or None
+          for one per CPU (default: 1, validate in this process).
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer or None")
         self.df = None
         self.valid_data = None
         self.invalid_data = None
         self.invalid_errors = None
         self.model_class = model_class
         self.class_name = class_name
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
         self.logger = self._setup_logger()
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _adapter_for(model_class):
+        """
+        Build the TypeAdapter validating a list of records against a model class.
+
+        Adapters are cached per model class and shared by every DataCleaning
+        instance, so each schema is only compiled once per process.
+
+        Args:
+        - model_class: The Pydantic model class to validate against.
+
+        Returns:
+        - TypeAdapter: An adapter for ``List[model_class]``.
+        """
+        return TypeAdapter(List[model_class])
+
+    @property
+    def _adapter(self):
+        """
+        TypeAdapter validating a list of records against the current model class.
+
+        Returns:
+        - TypeAdapter: The shared adapter for ``List[model_class]``.
+        """
+        return DataCleaning._adapter_for(self.model_class)
+
     def _setup_logger(self):
         """
         Set up a logger for recording errors during the data validation process.
@@ -675,27 +772,330 @@ class DataCleaning:
         """
         Validate and clean the data in the DataFrame using the specified Pydantic model.
 
-        This method iterates over each row in the DataFrame, validates the data
-        using the Pydantic model, and separates the valid and invalid data.
+        A vectorized pre-clean pass first normalises and checks whole columns.
+        The remaining rows are converted to plain records and validated in
+        batches of ``batch_size`` by a ``TypeAdapter`` for the Pydantic model.
+        With ``n_jobs`` above one, the records are split into contiguous slabs
+        validated in worker processes. When some records in a batch fail, the
+        errors are grouped by row, the failing rows are recorded as invalid
+        and the rest of the batch is validated again to build the clean data.
         Invalid data is logged with corresponding errors.
         """
         self.logger = self._setup_logger()
         self.valid_data = []
         self.invalid_data = []
         self.invalid_errors = []
-        for _, row in self.df.iterrows():
-            try:
-                model_instance = self.model_class(**row.to_dict())
-                self.valid_data.append(model_instance.dict())
-            except ValidationError as e:
-                self.invalid_data.append(row)
-                row_index = row.get("index", row.name)
-                self.invalid_errors.append(
-                    {"index": row_index, "errors": e.errors(), "data": row.to_dict()}
+        df = self._vectorized_preclean(self.df)
+        records = self._records(df)
+        slabs = np.array_split(np.arange(len(records)), self._slab_count(len(records)))
+        args = [
+            (self.model_class, records[slab[0] : slab[-1] + 1], self.batch_size)
+            for slab in slabs
+            if len(slab)
+        ]
+        if len(args) > 1:
+            with ProcessPoolExecutor(max_workers=len(args)) as executor:
+                results = list(executor.map(_validate_slab, *zip(*args)))
+        else:
+            results = [_validate_slab(*arg) for arg in args]
+
+        offset = 0
+        for (_, slab_records, _), (valid, failures) in zip(args, results):
+            for position, errors in failures:
+                self._record_invalid(
+                    slab_records[position], df.index[offset + position], errors
+                )
+            self.valid_data.extend(valid)
+            offset += len(slab_records)
+
+    def _slab_count(self, n_records):
+        """
+        Number of slabs the records are split into for parallel validation.
+
+        Args:
+        - n_records: The number of records to validate.
+
+        Returns:
+        - int: One slab per worker process, but never more slabs than batches.
+        """
+        n_jobs = self.n_jobs or os.cpu_count() or 1
+        return max(1, min(n_jobs, math.ceil(n_records / self.batch_size)))
+
+    def _vectorized_preclean(self, df):
+        """
+        Clean and check whole columns with pandas before Pydantic sees them.
+
+        Dates, card numbers, prices and weights are normalised a column at a
+        time and rows whose email address, UUID or EAN cannot be valid, or
+        whose staff numbers or product quantities are negative, are rejected
+        in bulk.
+        Values the vectorized pass cannot handle are left untouched, so the
+        model's field validators still have the final say on them.
+
+        Args:
+        - df: The DataFrame to clean.
+
+        Returns:
+        - DataFrame: A cleaned copy holding the rows that passed the checks.
+        """
+        df = df.copy()
+
+        if self.model_class is UserModel and "email_address" in df:
+            emails = self._strip_strings(df["email_address"])
+            valid = emails.str.replace("@@", "@", regex=False).str.match(
+                EMAIL_RE, na=False
+            )
+            df = self._reject(df, ~valid, "email_address", "Invalid email address")
+
+        if self.model_class is PaymentModel and "card_number" in df:
+            digits = self._strip_strings(df["card_number"]).str.replace(
+                NON_DIGIT_RE, "", regex=True
+            )
+            df["card_number"] = digits.where(digits.notna(), df["card_number"])
+
+        if self.model_class is ProductModel:
+            if "product_price" in df:
+                prices = pd.to_numeric(
+                    self._strip_strings(df["product_price"]).str.removeprefix("£"),
+                    errors="coerce",
                 )
-                self.logger.error(
-                    f"Validation error at index {row_index}: {e.errors()}"
+                df["product_price"] = prices.astype(object).where(
+                    prices.notna(), df["product_price"]
                 )
+            if "weight" in df:
+                parts = (
+                    self._strip_strings(df["weight"]).str.lower().str.extract(WEIGHT_RE)
+                )
+                grams = pd.to_numeric(parts[0], errors="coerce") * parts[1].map(
+                    WEIGHT_FACTORS
+                )
+                df["weight"] = grams.astype(object).where(grams.notna(), df["weight"])
+            if "EAN" in df:
+                eans = self._strip_strings(df["EAN"])
+                bad = eans.notna() & ~eans.str.fullmatch(r"\d+", na=False)
+                df = self._reject(df, bad, "EAN", "EAN should only contain digits")
+
+        for column in UUID_COLUMNS.get(self.model_class, ()):
+            if column in df:
+                bad = self._invalid_uuids(df[column])
+                df = self._reject(df, bad, column, "Invalid UUID")
+
+        for column in DATE_COLUMNS.get(self.model_class, ()):
+            if column in df:
+                df[column] = self._parse_dates(df[column])
+
+        if self.model_class is StoreModel and "staff_numbers" in df:
+            bad = self._negatives(df["staff_numbers"])
+            df = self._reject(df, bad, "staff_numbers", "Invalid staff number")
+
+        if self.model_class is OrderModel and "product_quantity" in df:
+            bad = self._negatives(df["product_quantity"])
+            df = self._reject(
+                df, bad, "product_quantity", "Product quantity must be greater than 0."
+            )
+
+        return df
+
+    def _parse_dates(self, series):
+        """
+        Parse the date strings of a column in one vectorized call.
+
+        Only strings in one of the exact ``DATE_FORMATS`` are parsed, so
+        nothing is accepted that the model's dateutil validators would
+        reject or read differently. Identical strings are only parsed once.
+        Other values, and values that are not strings, are returned
+        unchanged for the model's field validators to handle.
+
+        Args:
+        - series: The column holding the dates.
+
+        Returns:
+        - Series: The column with parsed values replaced by date objects.
+        """
+        texts = self._strip_strings(series)
+        # pandas reads "today" and "now" as timestamps whatever the format
+        texts = texts.where(texts.str.contains(r"\d", na=False))
+        parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+        for date_format in DATE_FORMATS:
+            pending = texts.notna() & parsed.isna()
+            if not pending.any():
+                break
+            parsed[pending] = pd.to_datetime(
+                texts[pending], errors="coerce", format=date_format, cache=True
+            )
+        return parsed.dt.date.where(parsed.notna(), series)
+
+    @staticmethod
+    def _invalid_uuids(series):
+        """
+        Flag the strings of a column that cannot be parsed as a UUID.
+
+        The check runs in pyarrow: the decorations ``UUID()`` tolerates (an
+        ``urn:uuid:`` prefix, braces and hyphens) are removed and what is left
+        must be exactly 32 hex digits. Values that are not strings are left to
+        the model's field validators.
+
+        Args:
+        - series: The column holding the UUIDs.
+
+        Returns:
+        - Series: Boolean mask marking the strings that are not UUIDs.
+        """
+        try:
+            texts = series.where(series.str.len().notna())
+        except AttributeError:
+            return pd.Series(False, index=series.index)
+        digits = pa.array(texts, type=pa.string(), from_pandas=True)
+        for decoration in ("urn:", "uuid:", "-"):
+            digits = pc.replace_substring(digits, decoration, "")
+        digits = pc.utf8_trim(digits, "{}")
+        valid = pc.match_substring_regex(digits, r"^[0-9a-fA-F]{32}$")
+        return pd.Series(
+            ~pc.fill_null(valid, True).to_numpy(zero_copy_only=False),
+            index=series.index,
+        )
+
+    def _negatives(self, series):
+        """
+        Flag the negative values of a column, numeric or string.
+
+        The sign of a string is checked before any cleaning, since the field
+        validators strip non-digit characters and would turn "-5" into 5.
+
+        Args:
+        - series: The column to check.
+
+        Returns:
+        - Series: True wherever the value is a negative number or a string
+          starting with a minus sign.
+        """
+        negative_strings = self._strip_strings(series).str.startswith("-", na=False)
+        return self._numbers(series).lt(0) | negative_strings
+
+    def _numbers(self, series):
+        """
+        Convert the numeric values of a column to numbers.
+
+        Strings are left to the model's field validators, which clean them
+        before converting.
+
+        Args:
+        - series: The column to convert.
+
+        Returns:
+        - Series: The numeric values, with NaN wherever a value is a string or
+          not a number.
+        """
+        return pd.to_numeric(
+            series.where(self._strip_strings(series).isna()), errors="coerce"
+        )
+
+    @staticmethod
+    def _strip_strings(series):
+        """
+        Strip the string values of a column.
+
+        Args:
+        - series: The column to strip.
+
+        Returns:
+        - Series: The stripped strings, with NaN wherever a value is not a string.
+        """
+        try:
+            return series.str.strip()
+        except AttributeError:  # The column holds no strings at all
+            return pd.Series(float("nan"), index=series.index, dtype=object)
+
+    @staticmethod
+    def _records(df):
+        """
+        Convert a DataFrame to a list of row dictionaries keyed by column.
+
+        Equivalent to ``df.to_dict(orient="records")``, but builds each row
+        from a plain tuple. Iterating the columns already yields native Python
+        scalars, so the extra per-value boxing pass of ``to_dict`` is skipped.
+        Frames whose column names are all strings use a builder generated for
+        those columns.
+
+        Args:
+        - df: The DataFrame to convert.
+
+        Returns:
+        - list: One dictionary per row.
+        """
+        columns = tuple(df.columns)
+        rows = df.itertuples(index=False, name=None)
+        if columns and all(isinstance(column, str) for column in columns):
+            return DataCleaning._record_builder(columns)(rows)
+        return [dict(zip(columns, row)) for row in rows]
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _record_builder(columns):
+        """
+        Generate a function turning row tuples into dictionaries for some columns.
+
+        The column names are baked into the generated code as a dictionary
+        display, so each row is unpacked and built in one step instead of
+        being zipped with the column names. Builders are cached per set of
+        columns.
+
+        Args:
+        - columns: Tuple of the column names, in order.
+
+        Returns:
+        - function: Takes an iterable of row tuples and returns a list of dicts.
+        """
+        # Column names only ever enter the source through repr(), as literals
+        names = [f"v{position}" for position in range(len(columns))]
+        items = ", ".join(f"{column!r}: {name}" for column, name in zip(columns, names))
+        source = (
+            "def build_records(rows):\n"
+            f"    return [{{{items}}} for ({', '.join(names)},) in rows]\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        return namespace["build_records"]
+
+    def _reject(self, df, mask, field, message):
+        """
+        Record the rows flagged by a vectorized check as invalid and drop them.
+
+        Args:
+        - df: The DataFrame being cleaned.
+        - mask: Boolean Series marking the rows that failed the check.
+        - field: The column that failed the check.
+        - message: The error message recorded for each failing row.
+
+        Returns:
+        - DataFrame: The rows that passed the check.
+        """
+        rejected = df[mask]
+        for label, record in zip(rejected.index, self._records(rejected)):
+            error = {
+                "type": "value_error",
+                "loc": (field,),
+                "msg": message,
+                "input": record[field],
+            }
+            self._record_invalid(record, label, [error])
+        return df[~mask]
+
+    def _record_invalid(self, record, label, errors):
+        """
+        Record a row that failed validation and log its errors.
+
+        Args:
+        - record: The row as a dictionary.
+        - label: The DataFrame label of the row, used when it has no 'index' value.
+        - errors: The validation errors for the row.
+        """
+        self.invalid_data.append(record)
+        row_index = record.get("index", label)
+        self.invalid_errors.append(
+            {"index": row_index, "errors": errors, "data": record}
+        )
+        self.logger.error("Validation error at index %s: %s", row_index, errors)
 
     def get_valid_data(self):
         """
@@ -739,6 +1139,61 @@ class DataCleaning:
             pd.DataFrame(self.invalid_data).to_csv(log_filename, index=False)
 
 
+def _validate_slab(model_class, records, batch_size):
+    """
+    Validate a slab of records in batches against a Pydantic model.
+
+    This is module-level so it can run in a worker process. The adapter comes
+    from the per-process cache, so each worker compiles a schema only once.
+
+    Args:
+    - model_class: The Pydantic model class used for validation.
+    - records: The records to validate.
+    - batch_size: Number of records validated per call.
+
+    Returns:
+    - tuple: The valid rows as dictionaries, and a list of ``(position,
+      errors)`` pairs for the rows that failed, with positions relative to
+      the slab.
+    """
+    adapter = DataCleaning._adapter_for(model_class)
+    valid, failures = [], []
+    for start in range(0, len(records), batch_size):
+        batch = records[start : start + batch_size]
+        try:
+            models = adapter.validate_python(batch)
+        except ValidationError as e:
+            row_errors = defaultdict(list)
+            for error in e.errors():
+                position, *loc = error["loc"]
+                error["loc"] = tuple(loc)
+                row_errors[position].append(error)
+
+            # Row bitmap of the failures, so both passes are plain index scans
+            failed = np.zeros(len(batch), dtype=bool)
+            failed[list(row_errors)] = True
+            failures.extend(
+                (start + position, row_errors[position])
+                for position in np.flatnonzero(failed).tolist()
+            )
+            remaining = [batch[position] for position in np.flatnonzero(~failed)]
+            models = adapter.validate_python(remaining) if remaining else []
+        valid.extend(model.model_dump() for model in models)
+    return valid, failures
+
+
+# Compile the list validators for the known models up front
+for _model_class in (
+    UserModel,
+    PaymentModel,
+    StoreModel,
+    ProductModel,
+    OrderModel,
+    DateModel,
+):
+    DataCleaning._adapter_for(_model_class)
+
+
 if __name__ == "__main__":
 
     # clean and validate Store_data
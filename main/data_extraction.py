@@ -14,7 +14,8 @@ Usage
 ------
 1. Initialize a `DatabaseConnector` instance with proper database credentials.
 2. Create a `DataExtractor` instance, passing the `DatabaseConnector` instance.
-3. Use the `read_rds_table` method to extract data from a specific database table.
+3. Use the `read_rds_table` method to extract data from a specific database table,
+   or `iter_rds_table` to stream a large table in chunks.
 
 Example
 -------
@@ -35,12 +36,16 @@ print(df.head())
 
 import io
 import json
+import logging
 import numpy as np
 from io import StringIO
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import boto3
 import pandas as pd
 import jpype
@@ -84,6 +89,7 @@ class DataExtractor(DatabaseConnector, DataCleaning):
 
     MAX_RETRIES = 3  # Maximum number of retries
     RETRY_DELAY = 2  # Delay between retries (in seconds)
+    POOL_SIZE = 32  # Connections kept open per API host
 
     def __init__(
         self, model_class: Optional[object] = UserModel, class_name="data_cleaning"
@@ -109,10 +115,19 @@ class DataExtractor(DatabaseConnector, DataCleaning):
 
         # Initialize the S3 client
         self.s3 = boto3.client("s3")
+        # Share keep-alive connections across API requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         # Initialize the database engine
         self.init_db_engine()
 
-    def read_rds_table(self, table_name: str) -> pd.DataFrame:
+    def read_rds_table(
+        self, table_name: str, dtype_backend: Optional[str] = None
+    ) -> pd.DataFrame:
         """
         Extracts a database table to a Pandas DataFrame.
 
@@ -120,6 +135,10 @@ class DataExtractor(DatabaseConnector, DataCleaning):
         ----------
         table_name : str
             The name of the table to read from the database.
+        dtype_backend : Optional[str], optional
+            Set to "pyarrow" to return Arrow-backed columns, which are faster
+            to filter and group. Default is None, which keeps NumPy dtypes as
+            expected by the data cleaning step.
 
         Returns
         -------
@@ -141,11 +160,58 @@ class DataExtractor(DatabaseConnector, DataCleaning):
 
         try:
             query = f"SELECT * FROM {table_name}"
+            kwargs = {"dtype_backend": dtype_backend} if dtype_backend else {}
             with self.engine.connect() as connection:
-                self.df = pd.read_sql(query, connection)
+                self.df = pd.read_sql(query, connection, **kwargs)
             return self.df
         except Exception as e:
-            self.logger.error(f"Failed to read data from table '{table_name}': {e}")
+            self.logger.error("Failed to read data from table '%s': %s", table_name, e)
+            raise RuntimeError(
+                f"Failed to read data from table '{table_name}': {e}"
+            ) from e
+
+    def iter_rds_table(
+        self, table_name: str, chunksize: int = 50_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams a database table as a sequence of Pandas DataFrames.
+
+        Rows are fetched through a server-side cursor, so only one chunk of
+        the table is held in memory at a time.
+
+        Parameters
+        ----------
+        table_name : str
+            The name of the table to read from the database.
+        chunksize : int, optional
+            The number of rows in each chunk. Default is 50,000.
+
+        Yields
+        ------
+        pd.DataFrame
+            The next chunk of the table.
+
+        Raises
+        ------
+        ValueError
+            If the table name is not a string.
+        RuntimeError
+            If the database engine is not initialized or data extraction fails.
+        """
+        if not isinstance(table_name, str):
+            raise ValueError("The table name must be a string.")
+
+        if self.engine is None:
+            raise RuntimeError("Database engine is not initialized.")
+
+        try:
+            query = f"SELECT * FROM {table_name}"
+            with self.engine.connect().execution_options(
+                stream_results=True, max_row_buffer=chunksize
+            ) as connection:
+                yield from pd.read_sql(query, connection, chunksize=chunksize)
+        except Exception as e:
+            self.logger.error("Failed to read data from table '%s': %s", table_name, e)
             raise RuntimeError(
                 f"Failed to read data from table '{table_name}': {e}"
             ) from e
@@ -177,7 +243,7 @@ class DataExtractor(DatabaseConnector, DataCleaning):
             self.df = pd.concat(dfs, ignore_index=True)
             return self.df
         except Exception as e:
-            self.logger.error(f"Failed to retrieve data from PDF: {e}")
+            self.logger.error("Failed to retrieve data from PDF: %s", e)
             raise RuntimeError(f"Failed to retrieve data from PDF: {e}") from e
 
     def list_number_of_stores(self, endpoint: str, headers: Dict[str, str]) -> int:
@@ -200,15 +266,19 @@ class DataExtractor(DatabaseConnector, DataCleaning):
         ------
         requests.RequestException
             If the API request fails.
+        orjson.JSONDecodeError
+            If the response is not valid JSON.
         """
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                response = requests.get(endpoint, headers=headers)
+                response = self.session.get(endpoint, headers=headers)
                 response.raise_for_status()
-                return response.json().get("number_stores", 0)
-            except requests.RequestException as e:
+                return orjson.loads(response.content).get("number_stores", 0)
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 self.logger.error(
-                    f"Attempt {attempt} failed to retrieve the number of stores: {e}"
+                    "Attempt %s failed to retrieve the number of stores: %s",
+                    attempt,
+                    e,
                 )
                 if attempt < self.MAX_RETRIES:
                     time.sleep(self.RETRY_DELAY)  # Wait before retrying
@@ -216,11 +286,19 @@ class DataExtractor(DatabaseConnector, DataCleaning):
                     raise
 
     def retrieve_stores_data(
-        self, endpoint: str, headers: Dict[str, str], num_stores: int
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        num_stores: int,
+        max_workers: int = POOL_SIZE,
     ) -> pd.DataFrame:
         """
         Retrieves store data from an API.
 
+        Stores are requested concurrently from a thread pool, since each
+        request spends nearly all of its time waiting on the network. The
+        rows keep the order of the store numbers.
+
         Parameters
         ----------
         endpoint : str
@@ -229,46 +307,78 @@ class DataExtractor(DatabaseConnector, DataCleaning):
             The headers to include in the API request.
         num_stores : int
             The number of stores to retrieve data for.
+        max_workers : int, optional
+            The maximum number of requests in flight at once. Default is 32.
 
         Returns
         -------
         pd.DataFrame
             DataFrame containing all store data.
-
-        Raises
-        ------
-        requests.RequestException
-            If the API request fails.
         """
-        stores_df = []
-        for store_index in range(0, num_stores):
-            url = endpoint.format(store_number=store_index)
-            for attempt in range(
-                1, self.MAX_RETRIES + 1
-            ):  # if failed, we allow to have another two attempts
-                try:
-                    response = requests.get(url, headers=headers)
-                    response.raise_for_status()
-                    stores_df.append(response.json())
-                    break  # Exit retry loop if successful
-                except requests.RequestException as e:
-                    self.logger.error(
-                        f"Attempt {attempt} failed for store number {store_index}: {e}"
-                    )
-                    if attempt < 3:
-                        time.sleep(self.RETRY_DELAY2)  # Wait 2 secs before retrying
-                    else:
-                        self.logger.error(
-                            f"Failed to retrieve data for store number {store_index} after 3 attempts."
-                        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            stores = executor.map(
+                lambda store_index: self._retrieve_store(
+                    endpoint, headers, store_index
+                ),
+                range(num_stores),
+            )
+            stores_df = [store for store in stores if store is not None]
 
         self.df = pd.DataFrame(stores_df)
         return self.df
 
+    def _retrieve_store(
+        self, endpoint: str, headers: Dict[str, str], store_index: int
+    ) -> Optional[dict]:
+        """
+        Retrieves the data of a single store, retrying failed requests.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint template to retrieve store data.
+        headers : Dict[str, str]
+            The headers to include in the API request.
+        store_index : int
+            The number of the store to retrieve.
+
+        Returns
+        -------
+        Optional[dict]
+            The store data, or None if every attempt failed.
+        """
+        url = endpoint.format(store_number=store_index)
+        for attempt in range(
+            1, self.MAX_RETRIES + 1
+        ):  # if failed, we allow to have another two attempts
+            try:
+                response = self.session.get(url, headers=headers)
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                self.logger.error(
+                    "Attempt %s failed for store number %s: %s",
+                    attempt,
+                    store_index,
+                    e,
+                )
+                if attempt < self.MAX_RETRIES:
+                    time.sleep(self.RETRY_DELAY)  # Wait before retrying
+
+        self.logger.error(
+            "Failed to retrieve data for store number %s after %s attempts.",
+            store_index,
+            self.MAX_RETRIES,
+        )
+        return None
+
     def extract_from_s3(self, s3_address: str) -> pd.DataFrame:
         """
         Extracts data from an S3 bucket and returns it as a DataFrame.
 
+        The object body is streamed into pandas' default C parser, so it is
+        read in blocks rather than downloaded whole first.
+
         Parameters
         ----------
         s3_address : str
@@ -288,11 +398,14 @@ class DataExtractor(DatabaseConnector, DataCleaning):
         file_key = "/".join(s3_address.split("/")[3:])
         try:
             obj = self.s3.get_object(Bucket=bucket_name, Key=file_key)
-            data = obj["Body"].read()
-            self.df = pd.read_csv(io.BytesIO(data))
+            # Hand the streaming body straight to the parser so the raw object
+            # is read in blocks instead of being buffered whole first. The C
+            # engine is kept on purpose: pyarrow's would leave "NULL" cells as
+            # strings, parse ISO dates and name the index column "".
+            self.df = pd.read_csv(obj["Body"])
             return self.df
         except Exception as e:
-            self.logger.error(f"Failed to extract data from S3: {e}")
+            self.logger.error("Failed to extract data from S3: %s", e)
             raise RuntimeError(f"Failed to extract data from S3: {e}") from e
 
     def extract_json_from_S3(self, link):
@@ -314,10 +427,10 @@ class DataExtractor(DatabaseConnector, DataCleaning):
         requests.RequestException
             If the request to retrieve the JSON data fails.
         """
-        r = requests.get(url=link)
+        r = self.session.get(url=link)
 
         if r.ok:
-            output = [r.json()]
+            output = [orjson.loads(r.content)]
         else:
             output = [{"error": r.content}]
 
@@ -353,6 +466,7 @@ class DataExtractor(DatabaseConnector, DataCleaning):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
 
     # 1. Extracting, cleaning, and validating data
     # 1.1 Initialize DataExtractor
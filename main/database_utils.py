@@ -7,25 +7,257 @@ uploading data to the database.
 
 Classes:
 --------
+PgCreds: Connection details for a PostgreSQL database.
 DatabaseConnector: Handles database connection and operations.
 
 Methods:
 --------
 - read_db_creds: Reads database credentials from a YAML file.
+- read_db_creds_from_py: Reads database credentials from a Python module.
 - init_db_engine: Initializes an SQLAlchemy engine.
 - list_db_tables: Lists all table names in the database.
-- upload_to_db: Uploads a Pandas DataFrame to a specified table.
+- invalidate_tables_cache: Forgets the cached table names.
+- upload_to_db: Uploads a Pandas DataFrame to a specified table using COPY.
+- upload_to_db_copy: Replaces a PostgreSQL table with a DataFrame using COPY.
+- upload_many: Uploads several DataFrames to their tables concurrently.
+- upload_to_db_async: Awaits the concurrent upload of several DataFrames.
+- insert_to_db: Appends a DataFrame to an existing table.
+- dispose_engines: Closes the pools of all shared engines.
 """
 
+import asyncio
+import importlib
+import io
+import os
 import time
 import logging
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 import yaml
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_batch
 import sqlalchemy
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.types import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    Time,
+    TypeEngine,
+)
+from sqlalchemy.util import LRUCache
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+CredsLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Parsed credentials files, keyed by path, as (modification time, contents)
+_creds_cache = {}
+
+
+@dataclass(frozen=True)
+class PgCreds:
+    """
+    Connection details for a PostgreSQL database.
+
+    Instances are immutable and hashable, so they can key the engine cache
+    directly. The SQLAlchemy URL is built on first use and kept on the
+    instance.
+
+    Attributes
+    ----------
+    user : str
+        The database user.
+    password : str
+        The user's password.
+    host : str
+        The database host.
+    port : int
+        The database port.
+    database : str
+        The name of the database.
+    """
+
+    user: str
+    password: str = field(repr=False)
+    host: str
+    port: int
+    database: str
+
+    @classmethod
+    def from_dict(cls, creds: Dict[str, str]) -> "PgCreds":
+        """
+        Creates the connection details from a credentials dictionary.
+
+        Parameters
+        ----------
+        creds : dict
+            A dictionary containing the ``RDS_*`` database credentials.
+
+        Returns
+        -------
+        PgCreds
+            The connection details.
+        """
+        return cls(
+            user=creds["RDS_USER"],
+            password=creds["RDS_PASSWORD"],
+            host=creds["RDS_HOST"],
+            port=int(creds["RDS_PORT"]),
+            database=creds["RDS_DATABASE"],
+        )
+
+    @cached_property
+    def url(self) -> URL:
+        """
+        The SQLAlchemy URL of the database.
+
+        The URL is built with ``URL.create`` so that credentials containing
+        characters such as ``@``, ``:`` or ``/`` are escaped correctly, and
+        is passed to SQLAlchemy as a ``URL`` so it is never parsed from a
+        string.
+        """
+        return URL.create(
+            "postgresql+psycopg2",
+            username=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+        )
+
+
+# SQL types to_sql infers for object columns holding these kinds of values
+_OBJECT_COLUMN_TYPES: Dict[str, TypeEngine] = {
+    "date": Date(),
+    "time": Time(),
+    "datetime": DateTime(),
+    "boolean": Boolean(),
+    "integer": BigInteger(),
+    "floating": Float(precision=53),
+}
+
+# Engines shared by every connector in the process, keyed by (creds, pool size)
+_engine_cache: Dict[Tuple[PgCreds, int], sqlalchemy.engine.Engine] = {}
+# Compiled SQL shared by those engines; entries are keyed by engine dialect
+_COMPILED_CACHE = LRUCache(1000)
+
+
+def _build_engine(creds: PgCreds, pool_size: int) -> sqlalchemy.engine.Engine:
+    """
+    Creates a new SQLAlchemy engine for a database and pool size.
+
+    The pool hands out the most recently returned connection first, so idle
+    connections can time out while the busy ones stay warm. Statements run
+    with many parameter sets are sent in pages rather than row by row:
+    INSERTs as multi-row VALUES and UPDATEs or DELETEs through psycopg2's
+    ``execute_batch``. Compiled SQL is cached in one bounded cache shared by
+    all engines rather than one per engine, so its memory use stays fixed
+    however many are created.
+
+    A pool size of 0 selects ``NullPool`` instead, which opens a connection
+    per checkout and closes it on release. That suits one-shot scripts,
+    which would otherwise leave pooled connections open until exit.
+
+    Parameters
+    ----------
+    creds : PgCreds
+        The connection details of the database.
+    pool_size : int
+        Number of connections kept in the pool, or 0 for no pooling.
+
+    Returns
+    -------
+    sqlalchemy.engine.Engine
+        The SQLAlchemy engine.
+    """
+    if pool_size:
+        pool_args = {
+            "pool_size": pool_size,
+            "max_overflow": 0,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "pool_use_lifo": True,
+        }
+    else:
+        pool_args = {"poolclass": NullPool}
+    return create_engine(
+        creds.url,
+        **pool_args,
+        executemany_mode="values_plus_batch",
+        execution_options={"compiled_cache": _COMPILED_CACHE},
+        connect_args={
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "application_name": "mrdc-uploader",
+        },
+    )
+
+
+def _engine_for(creds: PgCreds, pool_size: int) -> sqlalchemy.engine.Engine:
+    """
+    Returns the shared SQLAlchemy engine for a database and pool size.
+
+    Engines are created once per process, so every connector pointed at the
+    same database reuses one engine and its connection pool. Connectors
+    therefore never dispose shared engines; ``dispose_engines`` closes all
+    of them, for example when the process is shutting down.
+
+    Parameters
+    ----------
+    creds : PgCreds
+        The connection details of the database.
+    pool_size : int
+        Number of connections kept in the pool, or 0 for no pooling.
+
+    Returns
+    -------
+    sqlalchemy.engine.Engine
+        The SQLAlchemy engine.
+    """
+    key = (creds, pool_size)
+    engine = _engine_cache.get(key)
+    if engine is None:
+        engine = _engine_cache[key] = _build_engine(creds, pool_size)
+    return engine
+
+
+def _is_shared(engine: sqlalchemy.engine.Engine) -> bool:
+    """
+    Returns whether an engine is one of the shared, cached engines.
+
+    Parameters
+    ----------
+    engine : sqlalchemy.engine.Engine
+        The engine to look up.
+
+    Returns
+    -------
+    bool
+        True if the engine is in the shared engine cache.
+    """
+    return any(cached is engine for cached in _engine_cache.values())
+
+
+def dispose_engines() -> None:
+    """
+    Closes the connection pools of all shared engines and forgets them.
+
+    Connectors created afterwards get new engines.
+    """
+    while _engine_cache:
+        _, engine = _engine_cache.popitem()
+        engine.dispose()
+
 
 class DatabaseConnector:
     """
@@ -37,35 +269,52 @@ class DatabaseConnector:
         The path to the YAML file containing database credentials.
     target_creds_path : str
         The path to the YAML file containing target database credentials.
+    pooled : bool
+        Whether engines keep a pool of open connections.
     engine : sqlalchemy.engine.base.Engine
         The SQLAlchemy engine for the source database.
     target_engine : sqlalchemy.engine.base.Engine
         The SQLAlchemy engine for the target database.
     tables : list
         List of table names in the connected database.
-    logger : logging.Logger
-        Logger for recording operational messages.
 
     Methods
     -------
-    read_db_creds(file_path: str) -> Dict[str, str]
+    read_db_creds(file_path: Optional[str] = None) -> Dict[str, str]
         Reads database credentials from a YAML file.
+    read_db_creds_from_py(module_name: str = "db_creds_config") -> Dict[str, str]
+        Reads database credentials from the CREDS dict of a Python module.
     init_db_engine(retries: int = 3, delay: int = 5) -> None
-        Initializes and connects to the source database engine.
-    list_db_tables() -> None
+        Initializes the source database engine.
+    list_db_tables(include_views: bool = False) -> None
         Lists all tables in the source database.
+    invalidate_tables_cache() -> None
+        Forgets the table names cached by list_db_tables.
     upload_to_db(df: pd.DataFrame, table_name: str, retries: int = 3, delay: int = 5) -> None
         Uploads a DataFrame to the target database table.
+    upload_to_db_copy(df: pd.DataFrame, table_name: str) -> None
+        Replaces a PostgreSQL table with a DataFrame using COPY FROM STDIN.
+    upload_many(frames: Dict[str, pd.DataFrame], max_workers: int = 4) -> None
+        Uploads several DataFrames to the target database concurrently.
+    upload_to_db_async(items: List[Tuple[pd.DataFrame, str]], max_workers: int = 4) -> None
+        Uploads several DataFrames concurrently from asyncio code.
+    insert_to_db(df: pd.DataFrame, table_name: str, page_size: int = 1000) -> None
+        Appends a DataFrame to an existing table with a prepared statement.
     get_engine() -> sqlalchemy.engine.base.Engine
         Returns the SQLAlchemy engine for the source database.
     close_connections() -> None
         Closes the connections to the databases.
     """
 
+    REQUIRED_CREDS = frozenset(
+        {"RDS_USER", "RDS_PASSWORD", "RDS_HOST", "RDS_PORT", "RDS_DATABASE"}
+    )  # Keys every credentials file must provide
+
     def __init__(
         self,
         creds_path: str = "db_creds.yaml",
         target_creds_path: str = "target_db_creds.yaml",
+        pooled: bool = True,
     ):
         """
         Initializes the DatabaseConnector with the paths to the credentials files.
@@ -76,25 +325,27 @@ class DatabaseConnector:
             The path to the YAML file containing database credentials.
         target_creds_path : str
             The path to the YAML file containing target database credentials.
+        pooled : bool
+            Whether engines keep a pool of open connections. Pass False for
+            one-shot scripts so every connection is closed once released.
         """
         self.creds_path = creds_path
         self.target_creds_path = target_creds_path
+        self.pooled = pooled
         self.engine = None
         self.target_engine = None
         self.tables = []
+        self._tables_cache = {}
 
-        # Setup logger
-        self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.INFO)
-
-    def read_db_creds(self, file_path: str) -> Dict[str, str]:
+    def read_db_creds(self, file_path: Optional[str] = None) -> Dict[str, str]:
         """
         Reads the database credentials from a YAML file.
 
         Parameters
         ----------
-        file_path : str
+        file_path : str, optional
             The path to the YAML file containing database credentials.
+            Defaults to ``creds_path``.
 
         Returns
         -------
@@ -110,35 +361,160 @@ class DatabaseConnector:
         ValueError
             If the YAML file content is invalid.
         """
+        if file_path is None:
+            file_path = self.creds_path
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                creds = yaml.safe_load(file)
-                if not isinstance(creds, dict):
-                    raise ValueError("Invalid YAML format.")
-
-                required_keys = {
-                    "RDS_USER",
-                    "RDS_PASSWORD",
-                    "RDS_HOST",
-                    "RDS_PORT",
-                    "RDS_DATABASE",
-                }
-                if not required_keys.issubset(creds.keys()):
-                    raise ValueError("Missing required database credentials.")
-                return creds
+            creds = self._load_creds_file(file_path)
+            if not isinstance(creds, dict):
+                raise ValueError("Invalid YAML format.")
+            self._check_required_creds(creds)
+            return dict(creds)
         except FileNotFoundError:
-            self.logger.error("Credentials file not found.")
+            logger.error("Credentials file not found.")
             raise
         except yaml.YAMLError:
-            self.logger.error("Error parsing the YAML file.")
+            logger.error("Error parsing the YAML file.")
+            raise
+        except ValueError as e:
+            logger.error(str(e))
+            raise
+
+    def read_db_creds_from_py(
+        self, module_name: str = "db_creds_config"
+    ) -> Dict[str, str]:
+        """
+        Reads the database credentials from the ``CREDS`` dict of a Python module.
+
+        The module is imported normally, so Python compiles it to a ``.pyc``
+        once and every later call in the process is a ``sys.modules`` lookup
+        with no parsing at all. Edits to the module are therefore only seen
+        by new processes; use ``read_db_creds`` for configs that change
+        while running.
+
+        Parameters
+        ----------
+        module_name : str
+            The importable name of the module defining ``CREDS``.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the database credentials.
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the module cannot be imported.
+        ValueError
+            If the module has no ``CREDS`` dict or it is missing keys.
+        """
+        try:
+            creds = getattr(importlib.import_module(module_name), "CREDS", None)
+            if not isinstance(creds, dict):
+                raise ValueError(f"Module '{module_name}' does not define CREDS.")
+            self._check_required_creds(creds)
+            return dict(creds)
+        except ModuleNotFoundError:
+            logger.error("Credentials module '%s' not found.", module_name)
             raise
         except ValueError as e:
-            self.logger.error(str(e))
+            logger.error(str(e))
             raise
 
+    @classmethod
+    def _check_required_creds(cls, creds: Dict[str, str]) -> None:
+        """
+        Checks that a credentials dictionary has every required key.
+
+        Parameters
+        ----------
+        creds : dict
+            A dictionary containing the database credentials.
+
+        Raises
+        ------
+        ValueError
+            If any of ``REQUIRED_CREDS`` is missing.
+        """
+        if not cls.REQUIRED_CREDS.issubset(creds):
+            missing = ", ".join(sorted(cls.REQUIRED_CREDS - creds.keys()))
+            raise ValueError(f"Missing required database credentials: {missing}")
+
+    @staticmethod
+    def _load_creds_file(file_path: str):
+        """
+        Parses a credentials file, reusing the result while the file is unchanged.
+
+        The parsed contents are cached per path together with the file's
+        modification time, so repeated reads cost a ``stat`` call rather
+        than a YAML parse. Editing the file invalidates the entry. The cache
+        is held in memory only, so the credentials are never written to disk
+        in another form.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the YAML file.
+
+        Returns
+        -------
+        object
+            The parsed YAML document.
+        """
+        path = os.path.abspath(file_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None  # Not cacheable; let open() report the problem
+        cached = _creds_cache.get(path)
+        if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            creds = yaml.load(file, Loader=CredsLoader)
+        if mtime_ns is not None:
+            _creds_cache[path] = (mtime_ns, creds)
+        return creds
+
+    def _create_engine(
+        self, creds: Dict[str, str], pool_size: int = 2, shared: bool = True
+    ) -> sqlalchemy.engine.Engine:
+        """
+        Creates an SQLAlchemy engine from a credentials dictionary.
+
+        The credentials are converted to ``PgCreds``, whose escaped URL is
+        only built when no engine exists for them yet. The pool is kept
+        small for batch uploads, connections are validated on checkout and
+        TCP keepalives stop idle connections being dropped during
+        long-running writes. Engines are shared between connectors
+        using the same credentials and pool size. Connectors created with
+        ``pooled=False`` get an unpooled engine instead.
+
+        Parameters
+        ----------
+        creds : dict
+            A dictionary containing the database credentials.
+        pool_size : int
+            Number of connections kept in the pool.
+        shared : bool
+            Whether to return the shared engine. If False, a new engine is
+            created that only the caller uses and ``close_connections``
+            disposes.
+
+        Returns
+        -------
+        sqlalchemy.engine.Engine
+            The SQLAlchemy engine.
+        """
+        factory = _engine_for if shared else _build_engine
+        return factory(PgCreds.from_dict(creds), pool_size if self.pooled else 0)
+
     def init_db_engine(self, retries: int = 3, delay: int = 5) -> None:
         """
-        Initializes and connects to the source database engine, with retry logic.
+        Initializes the source database engine, with retry logic.
+
+        Connections are opened lazily by the pool on first use and validated
+        on checkout, so no connection is made here.
 
         Parameters
         ----------
@@ -155,25 +531,33 @@ class DatabaseConnector:
         for attempt in range(retries):
             try:
                 creds = self.read_db_creds(self.creds_path)
-                self.engine = create_engine(
-                    f"postgresql://{creds['RDS_USER']}:{creds['RDS_PASSWORD']}@{creds['RDS_HOST']}:{creds['RDS_PORT']}/{creds['RDS_DATABASE']}"
-                )
-                self.engine.connect()
-                self.logger.info("Database engine created successfully.")
+                self.engine = self._create_engine(creds)
+                logger.info("Database engine created successfully.")
                 break
             except (OperationalError, SQLAlchemyError) as e:
-                self.logger.error(f"Failed to create database engine: {e}")
+                logger.error("Failed to create database engine: %s", e)
                 if attempt < retries - 1:
-                    self.logger.info(f"Retrying in {delay} seconds...")
+                    logger.info("Retrying in %s seconds...", delay)
                     time.sleep(delay)
                 else:
                     raise SQLAlchemyError(
                         f"Failed to create database engine after {retries} attempts."
                     ) from e
 
-    def list_db_tables(self) -> None:
+    def list_db_tables(self, include_views: bool = False) -> None:
         """
-        Lists all tables in the connected database.
+        Lists all tables in the current schema of the connected database.
+
+        The names are read straight from ``pg_tables`` in a single query
+        rather than through SQLAlchemy's reflection machinery. The result is
+        cached per engine, so later calls do not query the catalog again
+        until ``invalidate_tables_cache`` is called. Uploads through this
+        connector invalidate the cache themselves.
+
+        Parameters
+        ----------
+        include_views : bool
+            Whether views in the current schema are listed as well.
 
         Raises
         ------
@@ -183,19 +567,42 @@ class DatabaseConnector:
             If the tables cannot be listed.
         """
         if not self.engine:
-            self.logger.error("Database engine is not initialized.")
+            logger.error("Database engine is not initialized.")
             raise ValueError("Database engine is not initialized.")
 
+        query = "SELECT tablename FROM pg_tables WHERE schemaname = current_schema()"
+        if include_views:
+            query += (
+                " UNION ALL"
+                " SELECT viewname FROM pg_views WHERE schemaname = current_schema()"
+            )
+
+        key = (self.engine, include_views)
+        if key in self._tables_cache:
+            self.tables = list(self._tables_cache[key])
+            return
+
         try:
-            inspector = inspect(self.engine)
-            self.tables = inspector.get_table_names()
-            self.logger.info(f"Tables in the database: {self.tables}")
+            with self.engine.connect() as connection:
+                self.tables = [row[0] for row in connection.execute(text(query))]
+            logger.info("Tables in the database: %s", self.tables)
         except SQLAlchemyError as e:
-            self.logger.error(f"Failed to list database tables: {e}")
+            logger.error("Failed to list database tables: %s", e)
             raise
+        self._tables_cache[key] = list(self.tables)
+
+    def invalidate_tables_cache(self) -> None:
+        """
+        Forgets the cached table names, e.g. after tables were created or dropped.
+        """
+        self._tables_cache.clear()
 
     def upload_to_db(
-        self, df: pd.DataFrame, table_name: str, retries: int = 3, delay: int = 5
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        retries: int = 3,
+        delay: int = 5,
     ) -> None:
         """
         Uploads a DataFrame to the target database table, with retry logic.
@@ -215,26 +622,24 @@ class DatabaseConnector:
         ------
         SQLAlchemyError
             If the upload fails after retries.
+        ValueError
+            If the table name is not a non-empty string or the DataFrame
+            has no rows.
         """
+        self._validate_upload(df, table_name)
         self.target_creds = self.read_db_creds(self.target_creds_path)
 
         for attempt in range(retries):
             try:
                 if not self.target_engine:
-                    self.target_engine = create_engine(
-                        f"postgresql://{self.target_creds['RDS_USER']}:{self.target_creds['RDS_PASSWORD']}@{self.target_creds['RDS_HOST']}:{self.target_creds['RDS_PORT']}/{self.target_creds['RDS_DATABASE']}"
-                    )
-                    self.target_engine.connect()
+                    self.target_engine = self._create_engine(self.target_creds)
 
-                df.to_sql(
-                    table_name, self.target_engine, if_exists="replace", index=False
-                )
-                self.logger.info(f"Data uploaded to table '{table_name}' successfully.")
+                self._copy_frame(df, table_name)
                 break
             except SQLAlchemyError as e:
-                self.logger.error(f"Failed to upload data to the database: {e}")
+                logger.error("Failed to upload data to the database: %s", e)
                 if attempt < retries - 1:
-                    self.logger.info(f"Retrying in {delay} seconds...")
+                    logger.info("Retrying in %s seconds...", delay)
                     time.sleep(delay)
                 else:
                     raise SQLAlchemyError(
@@ -243,6 +648,322 @@ class DatabaseConnector:
             finally:
                 self.close_connections()
 
+    def upload_many(
+        self, frames: Dict[str, pd.DataFrame], max_workers: int = 4
+    ) -> None:
+        """
+        Uploads several DataFrames to the target database concurrently.
+
+        Each table is written on its own pooled connection, so independent
+        tables load in parallel on separate database backends.
+
+        Parameters
+        ----------
+        frames : Dict[str, pd.DataFrame]
+            Mapping of table name to the DataFrame to upload to it.
+        max_workers : int
+            Number of tables uploaded at the same time.
+
+        Raises
+        ------
+        SQLAlchemyError
+            If any of the tables fails to upload.
+        ValueError
+            If any table name is not a non-empty string or any DataFrame
+            has no rows. Nothing is uploaded in that case.
+        """
+        for table_name, df in frames.items():
+            self._validate_upload(df, table_name)
+        self.target_creds = self.read_db_creds(self.target_creds_path)
+        self.target_engine = self._create_engine(
+            self.target_creds, pool_size=max_workers, shared=False
+        )
+
+        failed = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._copy_frame, df, table_name): table_name
+                    for table_name, df in frames.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except SQLAlchemyError as e:
+                        table_name = futures[future]
+                        logger.error(
+                            "Failed to upload data to table '%s': %s", table_name, e
+                        )
+                        failed.append(table_name)
+        finally:
+            self.close_connections()
+
+        if failed:
+            raise SQLAlchemyError(
+                f"Failed to upload tables: {', '.join(sorted(failed))}"
+            )
+
+    async def upload_to_db_async(
+        self, items: List[Tuple[pd.DataFrame, str]], max_workers: int = 4
+    ) -> None:
+        """
+        Uploads several DataFrames to the target database from asyncio code.
+
+        Each (DataFrame, table) pair is loaded with ``COPY`` on its own pooled
+        connection in a worker thread, and the uploads are awaited together
+        with ``asyncio.gather``. The event loop stays free while the tables
+        load, so a pipeline can keep extracting the next tables meanwhile.
+        If the coroutine is cancelled it returns at once; uploads already
+        running finish in the background and queued ones are not started.
+
+        Parameters
+        ----------
+        items : List[Tuple[pd.DataFrame, str]]
+            The DataFrames to upload, each with the name of its table.
+        max_workers : int
+            Number of tables uploaded at the same time.
+
+        Raises
+        ------
+        SQLAlchemyError
+            If any of the tables fails to upload.
+        ValueError
+            If any table name is not a non-empty string or any DataFrame
+            has no rows. Nothing is uploaded in that case.
+        """
+        for df, table_name in items:
+            self._validate_upload(df, table_name)
+        self.target_creds = self.read_db_creds(self.target_creds_path)
+        self.target_engine = self._create_engine(
+            self.target_creds, pool_size=max_workers, shared=False
+        )
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, self._copy_frame, df, table_name)
+                    for df, table_name in items
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            # Waiting for the workers here would block the event loop until
+            # every in-flight upload finished if the gather was cancelled
+            executor.shutdown(wait=False)
+            self.close_connections()
+
+        failed = []
+        for (_, table_name), result in zip(items, results):
+            if isinstance(result, SQLAlchemyError):
+                logger.error(
+                    "Failed to upload data to table '%s': %s", table_name, result
+                )
+                failed.append(table_name)
+            elif isinstance(result, BaseException):
+                raise result
+        if failed:
+            raise SQLAlchemyError(
+                f"Failed to upload tables: {', '.join(sorted(failed))}"
+            )
+
+    def upload_to_db_copy(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Replaces a PostgreSQL table with a DataFrame using ``COPY FROM STDIN``.
+
+        pandas only creates the (empty) table, replacing any existing one. The
+        rows are then streamed in as CSV with PostgreSQL's ``COPY``, which is
+        far faster than INSERT statements. Both steps run in one transaction.
+        Unlike ``upload_to_db`` there is no retry and the engine is left open.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data to upload.
+        table_name : str
+            The name of the table to upload the data to.
+
+        Raises
+        ------
+        SQLAlchemyError
+            If the rows cannot be copied into the table.
+        ValueError
+            If the table name is not a non-empty string or the DataFrame
+            has no rows.
+        """
+        self._validate_upload(df, table_name)
+        if not self.target_engine:
+            self.target_creds = self.read_db_creds(self.target_creds_path)
+            self.target_engine = self._create_engine(self.target_creds)
+        self._copy_frame(df, table_name)
+
+    def _copy_frame(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Replaces a table with a DataFrame using ``COPY`` on the target engine.
+
+        The table is created from an empty slice of the frame, so the column
+        types pandas would infer from the values of object columns are
+        passed in explicitly.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data to upload.
+        table_name : str
+            The name of the table to upload the data to.
+
+        Raises
+        ------
+        SQLAlchemyError
+            If the rows cannot be copied into the table.
+        """
+        # Missing values are written as an explicit \N marker: in CSV COPY an
+        # empty field is NULL, which would turn empty strings into NULLs too
+        copy = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')").format(
+            sql.Identifier(table_name),
+            sql.SQL(", ").join(sql.Identifier(str(column)) for column in df.columns),
+        )
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, header=False, na_rep="\\N")
+        buffer.seek(0)
+
+        with self.target_engine.begin() as connection:
+            df.head(0).to_sql(
+                table_name,
+                connection,
+                if_exists="replace",
+                index=False,
+                dtype=self._object_column_types(df),
+            )
+            try:
+                with connection.connection.cursor() as cursor:
+                    cursor.copy_expert(copy, buffer)
+            except psycopg2.Error as e:
+                raise SQLAlchemyError(
+                    f"Failed to copy data into table '{table_name}': {e}"
+                ) from e
+        self.invalidate_tables_cache()
+        logger.info("Data uploaded to table '%s' successfully.", table_name)
+
+    @staticmethod
+    def _object_column_types(df: pd.DataFrame) -> Dict[str, TypeEngine]:
+        """
+        Infers SQL types for the object columns of a DataFrame from their values.
+
+        pandas types an object column by the values it holds, for example
+        ``datetime.date`` objects become ``DATE``. An empty frame has no
+        values, so without these types every object column would be ``TEXT``.
+        The mapping matches the one ``to_sql`` applies to the full frame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame whose object columns are typed.
+
+        Returns
+        -------
+        dict
+            Mapping of column name to SQLAlchemy type, for the ``dtype``
+            argument of ``to_sql``. Columns left to pandas are omitted.
+        """
+        types = {}
+        for column in df.columns[df.dtypes == object]:
+            kind = pd.api.types.infer_dtype(df[column], skipna=True)
+            if kind in _OBJECT_COLUMN_TYPES:
+                types[column] = _OBJECT_COLUMN_TYPES[kind]
+        return types
+
+    def insert_to_db(
+        self, df: pd.DataFrame, table_name: str, page_size: int = 1000
+    ) -> None:
+        """
+        Appends the rows of a DataFrame to an existing target table.
+
+        This is the update path for tables that cannot be replaced wholesale.
+        The INSERT is prepared once on the server and then executed for each
+        row in batches of ``page_size``, so PostgreSQL parses and plans the
+        statement a single time.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the rows to append.
+        table_name : str
+            The name of the existing table to append the rows to.
+        page_size : int
+            Number of EXECUTE statements sent to the server per round-trip.
+
+        Raises
+        ------
+        SQLAlchemyError
+            If the rows cannot be inserted.
+        ValueError
+            If the table name is not a non-empty string or the DataFrame
+            has no rows.
+        """
+        self._validate_upload(df, table_name)
+        if not self.target_engine:
+            self.target_creds = self.read_db_creds(self.target_creds_path)
+            self.target_engine = self._create_engine(self.target_creds)
+
+        columns = list(df.columns)
+        prepare = sql.SQL(
+            "PREPARE upload_stmt AS INSERT INTO {} ({}) VALUES ({})"
+        ).format(
+            sql.Identifier(table_name),
+            sql.SQL(", ").join(sql.Identifier(str(column)) for column in columns),
+            sql.SQL(", ").join(sql.SQL(f"${i}") for i in range(1, len(columns) + 1)),
+        )
+        execute = f"EXECUTE upload_stmt ({', '.join(['%s'] * len(columns))})"
+        # One conversion to Python objects, with every missing value as NULL
+        rows = df.to_numpy(dtype=object, na_value=None).tolist()
+
+        connection = self.target_engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(prepare)
+                execute_batch(cursor, execute, rows, page_size=page_size)
+                cursor.execute("DEALLOCATE upload_stmt")
+            connection.commit()
+            logger.info("Data appended to table '%s' successfully.", table_name)
+        except psycopg2.Error as e:
+            # Discard the connection so the prepared statement cannot leak
+            # back into the pool.
+            connection.invalidate()
+            logger.error("Failed to append data to table '%s': %s", table_name, e)
+            raise SQLAlchemyError(
+                f"Failed to append data to table '{table_name}'."
+            ) from e
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _validate_upload(df: pd.DataFrame, table_name: str) -> None:
+        """
+        Checks a DataFrame and table name before any database work is done.
+
+        Uploads validate once on entry, so retries and the per-table workers
+        of ``upload_many`` do not repeat the checks.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to upload.
+        table_name : str
+            The name of the table to upload the data to.
+
+        Raises
+        ------
+        ValueError
+            If the table name is not a non-empty string or the DataFrame
+            has no rows.
+        """
+        if not isinstance(table_name, str) or not table_name:
+            raise ValueError("The table name must be a non-empty string.")
+        if len(df.index) == 0:
+            raise ValueError(f"Cannot upload an empty DataFrame to '{table_name}'.")
+
     def get_engine(self):
         """
         Returns the SQLAlchemy engine for the source database.
@@ -257,18 +978,26 @@ class DatabaseConnector:
     def close_connections(self) -> None:
         """
         Closes the connections to the databases.
+
+        Shared engines are only released, since other connectors may still
+        be using their pools. Engines created for this connector alone, such
+        as the one sized for ``upload_many``, are disposed.
         """
         if self.engine:
-            self.engine.dispose()
+            if not _is_shared(self.engine):
+                self.engine.dispose()
             self.engine = None  # Ensure it's set to None after disposal
         if self.target_engine:
-            self.target_engine.dispose()
+            if not _is_shared(self.target_engine):
+                self.target_engine.dispose()
             self.target_engine = None  # Ensure it's set to None after disposal
-        self.logger.info("Source database connection closed.")
-        self.logger.info("Target database connection closed.")
+        logger.info("Source database connection closed.")
+        logger.info("Target database connection closed.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Example usage
     db_connector = DatabaseConnector()
     db_connector.init_db_engine()
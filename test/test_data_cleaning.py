@@ -7,7 +7,9 @@ import unittest
 import pandas as pd
 from pydantic import ValidationError
 from unittest.mock import patch, MagicMock
+import math
 import os
+import re
 from main.data_cleaning import (
     DataCleaning,
     UserModel,
@@ -16,6 +18,15 @@ from main.data_cleaning import (
     ProductModel,
     DateModel,
     OrderModel,
+    EMAIL_RE,
+    WEIGHT_RE,
+    PHONE_DIAL_CODE_RE,
+    PHONE_BRACKET_RE,
+    PHONE_AREA_CODE_RE,
+    EXPIRY_RE,
+    NON_DIGIT_RE,
+    NON_NUMERIC_RE,
+    _validate_slab,
 )
 
 from datetime import date
@@ -119,6 +130,26 @@ class TestStoreModel(unittest.TestCase):
         )
         self.assertEqual(store.staff_numbers, 10)
 
+    def test_negative_staff_numbers(self):
+        # The sign is checked before non-digits are stripped, for any input type
+        for staff_numbers in (-5, "-5", " -5"):
+            with self.subTest(staff_numbers=staff_numbers):
+                with self.assertRaises(ValidationError):
+                    StoreModel(
+                        index=1,
+                        address="456 Elm St",
+                        longitude=0.1278,
+                        lat=None,
+                        latitude=51.5074,
+                        locality="London",
+                        store_code="STORE123",
+                        staff_numbers=staff_numbers,
+                        opening_date="2010-05-05",
+                        store_type="Retail",
+                        country_code="GB",
+                        continent="Europe",
+                    )
+
     def test_invalid_staff_numbers(self):
         with self.assertRaises(ValidationError):
             StoreModel(
@@ -229,6 +260,43 @@ class TestDateModel(unittest.TestCase):
             )
 
 
+class TestPatterns(unittest.TestCase):
+
+    def test_precompiled_regexes(self):
+        for pattern in (
+            EMAIL_RE,
+            WEIGHT_RE,
+            PHONE_DIAL_CODE_RE,
+            PHONE_BRACKET_RE,
+            PHONE_AREA_CODE_RE,
+            EXPIRY_RE,
+            NON_DIGIT_RE,
+            NON_NUMERIC_RE,
+        ):
+            self.assertIsInstance(pattern, re.Pattern)
+        self.assertTrue(EMAIL_RE.match("a@b.c"))
+        self.assertIsNone(EMAIL_RE.match("x"))
+        self.assertTrue(EXPIRY_RE.match("12/25"))
+        self.assertIsNone(EXPIRY_RE.match("13/25"))
+
+    def test_phone_number_cleaning(self):
+        user = UserModel(
+            index=1,
+            first_name="John",
+            last_name="Doe",
+            date_of_birth="1990-01-01",
+            company="Company Inc.",
+            email_address="john.doe@example.com",
+            address="123 Main St",
+            country="United Kingdom",
+            country_code="GB",
+            phone_number="(0)20 7946 0958",
+            join_date="2020-01-01",
+            user_uuid=UUID("123e4567-e89b-12d3-a456-426614174000"),
+        )
+        self.assertEqual(user.phone_number, "7946 0958")
+
+
 class TestDataCleaning(unittest.TestCase):
 
     def setUp(self):
@@ -283,9 +351,17 @@ class TestDataCleaning(unittest.TestCase):
         mock_logger = MagicMock()
         mock_setup_logger.return_value = mock_logger
 
-        # Set DataFrame and run validation
+        # Set DataFrame and run validation through the batch TypeAdapter
         self.data_cleaner.df = self.df
-        self.data_cleaner.validate_and_clean_data()
+        adapter = self.data_cleaner._adapter
+        with patch.object(
+            adapter, "validate_python", wraps=adapter.validate_python
+        ) as mock_validate_python:
+            self.data_cleaner.validate_and_clean_data()
+        self.assertTrue(mock_validate_python.called)
+        # The rows with an unusable email or UUID are rejected before Pydantic
+        validated = mock_validate_python.call_args_list[0][0][0]
+        self.assertEqual([record["index"] for record in validated], [1])
 
         # Check if valid data is processed correctly
         valid_data = self.data_cleaner.get_valid_data()
@@ -304,6 +380,357 @@ class TestDataCleaning(unittest.TestCase):
         error_message = mock_logger.error.call_args[0][0]
         self.assertIn("Validation error at index", error_message)
 
+    def test_adapter_follows_model_class(self):
+        user_adapter = self.data_cleaner._adapter
+        self.assertIs(self.data_cleaner._adapter, user_adapter)
+        self.data_cleaner.model_class = StoreModel
+        self.assertIsNot(self.data_cleaner._adapter, user_adapter)
+
+    def test_adapter_cached(self):
+        self.assertIs(
+            DataCleaning(model_class=UserModel)._adapter,
+            DataCleaning(model_class=UserModel)._adapter,
+        )
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_invalid_errors_fall_back_to_row_label(self, mock_setup_logger):
+        # Without an "index" column the DataFrame label identifies the row
+        self.data_cleaner.df = self.df.drop(columns=["index"]).set_axis([10, 11, 12])
+        self.data_cleaner.validate_and_clean_data()
+
+        indices = [error["index"] for error in self.data_cleaner.invalid_errors]
+        self.assertEqual(sorted(indices), [10, 11, 12])
+        self.assertEqual(len(self.data_cleaner.get_invalid_data()), 3)
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_vectorized_preclean_rejects_emails(self, mock_setup_logger):
+        self.data_cleaner.df = self.df
+        self.data_cleaner.validate_and_clean_data()
+
+        errors = {
+            error["index"]: error["errors"]
+            for error in self.data_cleaner.invalid_errors
+        }
+        # The '@@' typo is repaired rather than rejected; row 2 fails on its UUID
+        self.assertEqual(errors[3][0]["loc"], ("email_address",))
+        self.assertEqual(errors[2][0]["loc"], ("user_uuid",))
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_vectorized_preclean_rejects_uuids(self, mock_setup_logger):
+        cleaner = DataCleaning(model_class=OrderModel)
+        cleaner.df = pd.DataFrame(
+            {
+                "date_uuid": [
+                    "123e4567-e89b-12d3-a456-426614174000",
+                    "{123e4567-e89b-12d3-a456-426614174001}",
+                    "123e4567-e89b-12d3-a456-42661417400G",
+                ],
+                "user_uuid": [
+                    "123e4567e89b12d3a456426614174002",
+                    "NULL",
+                    "123e4567-e89b-12d3-a456-426614174003",
+                ],
+                "card_number": ["123456789012"] * 3,
+                "store_code": ["STORE123"] * 3,
+                "product_code": ["P123"] * 3,
+                "product_quantity": [1, 2, 3],
+            }
+        )
+        adapter = cleaner._adapter
+        with patch.object(
+            adapter, "validate_python", wraps=adapter.validate_python
+        ) as mock_validate_python:
+            cleaner.validate_and_clean_data()
+
+        mock_validate_python.assert_called_once()
+        self.assertEqual(len(mock_validate_python.call_args[0][0]), 1)
+        errors = {error["index"]: error["errors"] for error in cleaner.invalid_errors}
+        self.assertEqual(errors[1][0]["loc"], ("user_uuid",))
+        self.assertEqual(errors[2][0]["loc"], ("date_uuid",))
+        self.assertEqual(len(cleaner.get_valid_data()), 1)
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_vectorized_preclean_dates(self, mock_setup_logger):
+        df = self.df.copy()
+        df["email_address"] = "john.doe@example.com"
+        df["user_uuid"] = "123e4567-e89b-12d3-a456-426614174000"
+        df["date_of_birth"] = ["1990/01/01", "12 May 1985", "1500-01-01"]
+
+        precleaned = self.data_cleaner._vectorized_preclean(df)
+        self.assertEqual(precleaned["date_of_birth"].iloc[0], date(1990, 1, 1))
+        self.assertEqual(precleaned["date_of_birth"].iloc[1], date(1985, 5, 12))
+        self.assertEqual(precleaned["join_date"].iloc[0], date(2020, 1, 1))
+        # Dates pandas cannot hold are left for the model's validator
+        self.assertEqual(precleaned["date_of_birth"].iloc[2], "1500-01-01")
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_vectorized_preclean_dates_match_model(self, mock_setup_logger):
+        cleaner = DataCleaning(model_class=PaymentModel)
+        cleaner.df = pd.DataFrame(
+            {
+                "index": [0, 1, 2],
+                "card_number": ["1234567898765432"] * 3,
+                "expiry_date": ["12/25"] * 3,
+                "card_provider": ["Visa"] * 3,
+                "date_payment_confirmed": ["2023-01-01", "today", "2005"],
+            }
+        )
+        precleaned = cleaner._vectorized_preclean(cleaner.df)
+        # Keywords and partial dates are left for the model's validator
+        self.assertEqual(
+            list(precleaned["date_payment_confirmed"]),
+            [date(2023, 1, 1), "today", "2005"],
+        )
+
+        cleaner.validate_and_clean_data()
+        errors = {error["index"]: error["errors"] for error in cleaner.invalid_errors}
+        self.assertEqual(list(errors), [1])
+        self.assertEqual(errors[1][0]["loc"], ("date_payment_confirmed",))
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_vectorized_preclean_products(self, mock_setup_logger):
+        cleaner = DataCleaning(model_class=ProductModel)
+        cleaner.df = pd.DataFrame(
+            {
+                "product_name": ["Gadget", "Widget", "Gizmo"],
+                "product_price": ["£9.99", " £1.50", "free"],
+                "weight": ["1kg", "12 x 100g", "16oz"],
+                "category": ["Electronics", "Electronics", "Toys"],
+                "EAN": ["1234567890123", "1234567890124", "1234567890125"],
+                "date_added": ["2023-06-01", "2023-06-02", "2023-06-03"],
+                "uuid": [
+                    "83dc0a69-f96f-4c34-bcb7-928acae19a94",
+                    "83dc0a69-f96f-4c34-bcb7-928acae19a95",
+                    "83dc0a69-f96f-4c34-bcb7-928acae19a96",
+                ],
+                "removed": ["Still_avaliable", "Removed", "Removed"],
+                "product_code": ["G123", "W123", "Z123"],
+            }
+        )
+
+        precleaned = cleaner._vectorized_preclean(cleaner.df)
+        self.assertEqual(precleaned["product_price"].tolist()[:2], [9.99, 1.5])
+        self.assertEqual(precleaned["product_price"].iloc[2], "free")
+        self.assertEqual(precleaned["weight"].iloc[0], 1000)
+        # Anything the vectorized pass cannot parse is left to the model
+        self.assertEqual(precleaned["weight"].iloc[1], "12 x 100g")
+        self.assertAlmostEqual(precleaned["weight"].iloc[2], 16 * 28.3495)
+
+        cleaner.validate_and_clean_data()
+        valid_data = cleaner.get_valid_data()
+        self.assertEqual(valid_data["product_price"].tolist(), [9.99, 1.5])
+        self.assertEqual(valid_data["weight"].iloc[0], 1000)
+        self.assertEqual(len(cleaner.invalid_errors), 1)
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_vectorized_preclean_rejects_ean(self, mock_setup_logger):
+        cleaner = DataCleaning(model_class=ProductModel)
+        product = {
+            "product_name": "Gadget",
+            "product_price": "£9.99",
+            "weight": "1kg",
+            "category": "Electronics",
+            "date_added": "2023-06-01",
+            "uuid": "83dc0a69-f96f-4c34-bcb7-928acae19a94",
+            "removed": "Still_avaliable",
+            "product_code": "G123",
+        }
+        cleaner.df = pd.DataFrame(
+            [{**product, "EAN": " 1234567890123"}, {**product, "EAN": "ABC123"}]
+        )
+        adapter = cleaner._adapter
+        with patch.object(
+            adapter, "validate_python", wraps=adapter.validate_python
+        ) as mock_validate_python:
+            cleaner.validate_and_clean_data()
+
+        # Only the row with a numeric EAN reaches Pydantic
+        self.assertEqual(len(mock_validate_python.call_args[0][0]), 1)
+        self.assertEqual(len(cleaner.get_valid_data()), 1)
+        self.assertEqual(cleaner.invalid_errors[0]["errors"][0]["loc"], ("EAN",))
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_store_range_vectorized(self, mock_setup_logger):
+        rows = 10_000
+        cleaner = DataCleaning(model_class=StoreModel)
+        cleaner.df = pd.DataFrame(
+            {
+                "index": range(rows),
+                "address": "456 Elm St",
+                "longitude": 0.1278,
+                "lat": None,
+                "locality": "London",
+                "store_code": "STORE123",
+                "staff_numbers": -5,
+                "opening_date": "2010-05-05",
+                "store_type": "Retail",
+                "latitude": 51.5074,
+                "country_code": "GB",
+                "continent": "Europe",
+            }
+        )
+        adapter = cleaner._adapter
+        with patch.object(
+            adapter, "validate_python", wraps=adapter.validate_python
+        ) as mock_validate_python:
+            cleaner.validate_and_clean_data()
+
+        # Every row is rejected in bulk, so Pydantic validates no records
+        mock_validate_python.assert_not_called()
+        self.assertEqual(len(cleaner.invalid_errors), rows)
+        self.assertEqual(
+            cleaner.invalid_errors[0]["errors"][0]["loc"], ("staff_numbers",)
+        )
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_store_negative_string_staff_numbers(self, mock_setup_logger):
+        cleaner = DataCleaning(model_class=StoreModel)
+        cleaner.df = pd.DataFrame(
+            {
+                "index": [0, 1, 2],
+                "address": "456 Elm St",
+                "longitude": 0.1278,
+                "lat": None,
+                "locality": "London",
+                "store_code": "STORE123",
+                "staff_numbers": ["-5", -5, "J78"],
+                "opening_date": "2010-05-05",
+                "store_type": "Retail",
+                "latitude": 51.5074,
+                "country_code": "GB",
+                "continent": "Europe",
+            }
+        )
+        cleaner.validate_and_clean_data()
+
+        # "-5" is rejected like -5 instead of being cleaned to 5
+        self.assertEqual(len(cleaner.invalid_errors), 2)
+        self.assertEqual(cleaner.get_valid_data()["staff_numbers"].tolist(), [78])
+
+    def test_records_match_to_dict(self):
+        df = pd.DataFrame(
+            {
+                "int": [1, 2],
+                "float": [1.5, np.nan],
+                "text": ["a", None],
+                "when": pd.to_datetime(["2020-01-01", "2021-06-15"]),
+                "mixed": [date(2020, 1, 1), 3.0],
+            }
+        )
+        records = DataCleaning._records(df)
+        expected = df.to_dict(orient="records")
+        self.assertEqual(len(records), len(expected))
+        for record, row in zip(records, expected):
+            self.assertEqual(list(record), list(row))
+            for key, value in row.items():
+                if isinstance(value, float) and math.isnan(value):
+                    self.assertTrue(math.isnan(record[key]))
+                else:
+                    self.assertEqual(record[key], value)
+                    self.assertIs(type(record[key]), type(value))
+
+    def test_record_builder_generated(self):
+        columns = ("index", "first name", "it's")
+        build = DataCleaning._record_builder(columns)
+        self.assertIs(DataCleaning._record_builder(columns), build)
+
+        def constants(code):
+            for const in code.co_consts:
+                if hasattr(const, "co_consts"):
+                    yield from constants(const)
+                elif isinstance(const, tuple):
+                    yield from const
+                else:
+                    yield const
+
+        # The column names are literals in the generated code
+        self.assertTrue(set(columns) <= set(constants(build.__code__)))
+        self.assertEqual(
+            build([(1, "John", "x"), (2, "Jane", None)]),
+            [
+                {"index": 1, "first name": "John", "it's": "x"},
+                {"index": 2, "first name": "Jane", "it's": None},
+            ],
+        )
+        # Frames with non-string column names fall back to zipping each row
+        df = pd.DataFrame([[1, 2]], columns=[0, "a"])
+        self.assertEqual(DataCleaning._records(df), [{0: 1, "a": 2}])
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_batch_size_param(self, mock_setup_logger):
+        df = self.df.copy()
+        df["email_address"] = "john.doe@example.com"
+        df["user_uuid"] = "123e4567-e89b-12d3-a456-426614174000"
+        for batch_size, calls in ((1, 3), (2, 2), (32, 2)):
+            with self.subTest(batch_size=batch_size):
+                cleaner = DataCleaning(model_class=UserModel, batch_size=batch_size)
+                cleaner.df = df
+                adapter = cleaner._adapter
+                with patch.object(
+                    adapter, "validate_python", wraps=adapter.validate_python
+                ) as mock_validate_python:
+                    cleaner.validate_and_clean_data()
+
+                # Batches with some valid rows are validated again without the bad ones
+                self.assertEqual(mock_validate_python.call_count, calls)
+                self.assertEqual(cleaner.get_valid_data()["index"].tolist(), [1, 2])
+                self.assertEqual(
+                    [error["index"] for error in cleaner.invalid_errors], [3]
+                )
+
+    def _repeated_users(self, times):
+        # Only the invalid join date of every third row fails in Pydantic
+        df = pd.concat([self.df] * times, ignore_index=True)
+        df["index"] = range(len(df))
+        df["email_address"] = "john.doe@example.com"
+        df["user_uuid"] = "123e4567-e89b-12d3-a456-426614174000"
+        return df
+
+    @patch("main.data_cleaning.ProcessPoolExecutor")
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_parallel_validation(self, mock_setup_logger, mock_pool):
+        # Run the workers' map in this process so the slabs can be inspected
+        executor = mock_pool.return_value.__enter__.return_value
+        executor.map.side_effect = map
+        cleaner = DataCleaning(model_class=UserModel, batch_size=2, n_jobs=3)
+        cleaner.df = self._repeated_users(4)
+        cleaner.validate_and_clean_data()
+
+        mock_pool.assert_called_once_with(max_workers=3)
+        func, model_classes, slabs, batch_sizes = executor.map.call_args[0]
+        self.assertIs(func, _validate_slab)
+        self.assertEqual(list(model_classes), [UserModel] * 3)
+        self.assertEqual([len(slab) for slab in slabs], [4, 4, 4])
+        # Errors are mapped back to the original rows across slabs
+        self.assertEqual(
+            cleaner.get_valid_data()["index"].tolist(), [0, 1, 3, 4, 6, 7, 9, 10]
+        )
+        self.assertEqual(
+            [error["index"] for error in cleaner.invalid_errors], [2, 5, 8, 11]
+        )
+
+    @patch("main.data_cleaning.DataCleaning._setup_logger")
+    def test_parallel_validation_processes(self, mock_setup_logger):
+        df = self._repeated_users(2)
+        serial = DataCleaning(model_class=UserModel, batch_size=1)
+        serial.df = df
+        serial.validate_and_clean_data()
+        parallel = DataCleaning(model_class=UserModel, batch_size=1, n_jobs=2)
+        parallel.df = df
+        parallel.validate_and_clean_data()
+
+        self.assertEqual(parallel.valid_data, serial.valid_data)
+        self.assertEqual(
+            [error["index"] for error in parallel.invalid_errors],
+            [error["index"] for error in serial.invalid_errors],
+        )
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            DataCleaning(batch_size=0)
+        with self.assertRaises(ValueError):
+            DataCleaning(n_jobs=0)
+
     @patch("os.makedirs")
     def test_save_invalid_data_log(self, mock_makedirs):
         # Mocking logger setup to avoid file creation
@@ -1,16 +1,46 @@
+import io
 import unittest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock
+import orjson
 import pandas as pd
+import requests
+from botocore.response import StreamingBody
+from sqlalchemy.engine import Connection, Engine
 from io import StringIO
 from main.data_extraction import DataExtractor
 from main.database_utils import DatabaseConnector
 
 
+def _mock_engine():
+    """Returns a Mock(spec=Engine) whose connections open as context managers."""
+    engine = Mock(spec=Engine)
+    connection = Mock(spec=Connection)
+    connection.__enter__ = Mock(return_value=connection)
+    connection.__exit__ = Mock(return_value=False)
+    connection.execution_options.return_value = connection
+    engine.connect.return_value = connection
+    return engine
+
+
 class TestDataExtractor(unittest.TestCase):
 
+    CREDS = {
+        "RDS_USER": "user",
+        "RDS_PASSWORD": "pass",
+        "RDS_HOST": "localhost",
+        "RDS_PORT": 5432,
+        "RDS_DATABASE": "db",
+    }
+
     @patch("main.data_extraction.boto3.client")
     def setUp(self, mock_boto_client):
+        # The credentials files only exist in CI, so serve them from memory
+        read_db_creds = patch.object(
+            DatabaseConnector, "read_db_creds", return_value=dict(self.CREDS)
+        )
+        read_db_creds.start()
+        self.addCleanup(read_db_creds.stop)
         # Initialize the DataExtractor object with mocks
         self.extractor = DataExtractor()
 
@@ -19,10 +49,57 @@ class TestDataExtractor(unittest.TestCase):
         # Mocking the database query result
         mock_df = pd.DataFrame({"column1": [1, 2, 3]})
         mock_read_sql.return_value = mock_df
+        self.extractor.engine = _mock_engine()
 
         result_df = self.extractor.read_rds_table("test_table")
-        self.assertEqual(result_df.equals(mock_df), True)
+        pd.testing.assert_frame_equal(
+            result_df, mock_df, check_dtype=False, check_like=True
+        )
         mock_read_sql.assert_called_once()
+        self.assertNotIn("dtype_backend", mock_read_sql.call_args[1])
+
+    @patch("main.data_extraction.pd.read_sql")
+    def test_read_rds_table_arrow_backend(self, mock_read_sql):
+        mock_df = pd.DataFrame({"column1": [1, 2, 3]}).convert_dtypes(
+            dtype_backend="pyarrow"
+        )
+        mock_read_sql.return_value = mock_df
+        self.extractor.engine = _mock_engine()
+
+        result_df = self.extractor.read_rds_table("test_table", dtype_backend="pyarrow")
+        pd.testing.assert_frame_equal(
+            result_df,
+            pd.DataFrame({"column1": [1, 2, 3]}),
+            check_dtype=False,
+            check_like=True,
+        )
+        self.assertEqual(mock_read_sql.call_args[1]["dtype_backend"], "pyarrow")
+
+    @patch("main.data_extraction.pd.read_sql")
+    def test_iter_rds_table(self, mock_read_sql):
+        fetched = []
+
+        def read_chunks(*args, **kwargs):
+            for start in (0, 2):
+                fetched.append(start)
+                yield pd.DataFrame({"column1": [start + 1, start + 2]})
+
+        mock_read_sql.side_effect = read_chunks
+        mock_engine = _mock_engine()
+        self.extractor.engine = mock_engine
+
+        chunks = self.extractor.iter_rds_table("test_table", chunksize=2)
+        first = next(chunks)
+        # The second chunk is not fetched until the first has been consumed
+        self.assertEqual(fetched, [0])
+        self.assertEqual(first["column1"].tolist(), [1, 2])
+        self.assertEqual(next(chunks)["column1"].tolist(), [3, 4])
+        self.assertEqual(list(chunks), [])
+
+        mock_engine.connect.return_value.execution_options.assert_called_once_with(
+            stream_results=True, max_row_buffer=2
+        )
+        self.assertEqual(mock_read_sql.call_args[1]["chunksize"], 2)
 
     @patch("main.data_extraction.jpype.startJVM")
     @patch("main.data_extraction.tabula.read_pdf")
@@ -32,14 +109,16 @@ class TestDataExtractor(unittest.TestCase):
         mock_read_pdf.return_value = [mock_df]
 
         result_df = self.extractor.retrieve_pdf_data("test_link")
-        self.assertEqual(result_df.equals(mock_df), True)
+        pd.testing.assert_frame_equal(
+            result_df, mock_df, check_dtype=False, check_like=True
+        )
         mock_read_pdf.assert_called_once()
 
-    @patch("main.data_extraction.requests.get")
+    @patch("main.data_extraction.requests.Session.get")
     def test_list_number_of_stores(self, mock_get):
         # Mocking the API response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"number_stores": 10}
+        mock_response.content = orjson.dumps({"number_stores": 10})
         mock_get.return_value = mock_response
 
         num_stores = self.extractor.list_number_of_stores(
@@ -48,7 +127,41 @@ class TestDataExtractor(unittest.TestCase):
         self.assertEqual(num_stores, 10)
         mock_get.assert_called_once()
 
-    @patch("main.data_extraction.requests.get")
+    @patch("main.data_extraction.time.sleep")
+    @patch("main.data_extraction.requests.Session.get")
+    def test_list_number_of_stores_retries_bad_json(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            MagicMock(content=b"<html>busy</html>"),
+            MagicMock(content=orjson.dumps({"number_stores": 10})),
+        ]
+
+        num_stores = self.extractor.list_number_of_stores(
+            "test_endpoint", {"header": "value"}
+        )
+        self.assertEqual(num_stores, 10)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @patch("main.data_extraction.requests.Session.get")
+    def test_extract_json_from_S3(self, mock_get):
+        mock_get.return_value = MagicMock(
+            ok=True,
+            content=orjson.dumps({"month": ["1", "2"], "year": ["2020", "2021"]}),
+        )
+
+        result_df = self.extractor.extract_json_from_S3("https://bucket/dates.json")
+
+        expected_df = pd.DataFrame({"month": ["1", "2"], "year": ["2020", "2021"]})
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_session_pool(self):
+        session = self.extractor.session
+        self.assertIsInstance(session, requests.Session)
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, DataExtractor.POOL_SIZE)
+        self.assertIs(session.get_adapter("http://example.com"), adapter)
+
+    @patch("main.data_extraction.requests.Session.get")
     def test_retrieve_stores_data(self, mock_get):
         # Mocking the API responses for two stores with flat structures
         mock_responses = [
@@ -56,15 +169,13 @@ class TestDataExtractor(unittest.TestCase):
             {"index": 2, "country_code": "DE", "continent": "Europe"},
         ]
 
-        # Mocking requests.get to return different responses for each API call
-        mock_get.side_effect = [
-            MagicMock(
-                json=lambda: mock_responses[0]
-            ),  # First API call returns the first store
-            MagicMock(
-                json=lambda: mock_responses[1]
-            ),  # Second API call returns the second store
-        ]
+        # Mocking session.get to return the response for each store's URL,
+        # as the stores are requested concurrently
+        responses = {
+            f"test_endpoint/{number}": MagicMock(content=orjson.dumps(data))
+            for number, data in enumerate(mock_responses)
+        }
+        mock_get.side_effect = lambda url, headers: responses[url]
 
         # Call the method being tested
         result_df = self.extractor.retrieve_stores_data(
@@ -79,10 +190,32 @@ class TestDataExtractor(unittest.TestCase):
         print("Result DataFrame:\n", result_df)
 
         # Assert that the two DataFrames are equal
-        self.assertTrue(result_df.equals(expected_df))
-        # Ensure requests.get was called twice
+        pd.testing.assert_frame_equal(
+            result_df, expected_df, check_dtype=False, check_like=True
+        )
+        # Ensure session.get was called twice
         self.assertEqual(mock_get.call_count, 2)
 
+    @patch("main.data_extraction.time.sleep")
+    @patch("main.data_extraction.requests.Session.get")
+    def test_retrieve_stores_data_skips_failed_store(self, mock_get, mock_sleep):
+        failing = MagicMock()
+        failing.raise_for_status.side_effect = requests.HTTPError("404")
+        responses = {
+            "test_endpoint/0": failing,
+            "test_endpoint/1": MagicMock(content=orjson.dumps({"index": 2})),
+        }
+        mock_get.side_effect = lambda url, headers: responses[url]
+
+        result_df = self.extractor.retrieve_stores_data(
+            "test_endpoint/{store_number}", {"header": "value"}, 2
+        )
+
+        self.assertEqual(result_df["index"].tolist(), [2])
+        # One call for the good store, every retry for the failing one
+        self.assertEqual(mock_get.call_count, 1 + DataExtractor.MAX_RETRIES)
+        self.assertEqual(mock_sleep.call_count, DataExtractor.MAX_RETRIES - 1)
+
     @patch("main.data_extraction.requests.get")
     def test_extract_from_s3(self, mock_s3_client):
         # Create a mock S3 client
@@ -105,33 +238,53 @@ class TestDataExtractor(unittest.TestCase):
     @patch("boto3.client")
     def test_extract_from_s3(self, mock_s3_client):
 
-        # Create a mock S3 client
-        mock_s3 = mock_s3_client.return_value
-
-        # Mock the get_object method to return bytes data
-        mock_s3_object = MagicMock()
-        mock_s3_object.read.return_value = b"col1,col2\nval1,val2\nval3,val4\n"
-
-        mock_s3_client.get_object.return_value = {"Body": mock_s3_object}
-
-        # Initialize DataExtractor
+        # Mock the get_object method to return a streaming body, as boto3 does
+        data = b"col1,col2\nval1,val2\nval3,val4\n"
+        body = StreamingBody(io.BytesIO(data), len(data))
+        mock_s3_client.get_object.return_value = {"Body": body}
 
         self.extractor.s3 = mock_s3_client
 
-        mock_s3.get_object.return_value = {
-            "Body": MagicMock(
-                read=MagicMock(return_value=b"col1,col2\nval1,val2\nval3,val4\n")
-            )
-        }
-
         # Call the method being tested
-        result_df = self.extractor.extract_from_s3("s3://bucket_name/path/to/file.csv")
+        with patch.object(body, "read", wraps=body.read) as mock_read:
+            result_df = self.extractor.extract_from_s3(
+                "s3://bucket_name/path/to/file.csv"
+            )
 
         # Expected DataFrame
         expected_df = pd.DataFrame({"col1": ["val1", "val3"], "col2": ["val2", "val4"]})
 
         # Assert that the DataFrame matches the expected DataFrame
         pd.testing.assert_frame_equal(result_df, expected_df)
+        mock_s3_client.get_object.assert_called_once_with(
+            Bucket="bucket_name", Key="path/to/file.csv"
+        )
+        # The body is streamed in bounded blocks, never read whole
+        self.assertTrue(mock_read.call_args_list)
+        for call in mock_read.call_args_list:
+            self.assertTrue(call.args and call.args[0])
+
+    def test_extract_from_s3_products_csv(self):
+        # Shaped like the products file: a leading unnamed index column,
+        # NULL cells and ISO dates
+        data = (
+            b",product_name,product_price,date_added,uuid\n"
+            b"0,Widget,\xc2\xa39.99,2005-12-02,83dc0a69-f96f-4c34-bcb7-928acae19a94\n"
+            b"1,NULL,NULL,NULL,NULL\n"
+            b"2,Gadget,\xc2\xa34.50,2006-01-03,5d3f4b7e-1c9a-4e0b-9f6a-2b8c7d6e5f41\n"
+        )
+        mock_s3 = MagicMock()
+        mock_s3.get_object.return_value = {
+            "Body": StreamingBody(io.BytesIO(data), len(data))
+        }
+        self.extractor.s3 = mock_s3
+
+        result_df = self.extractor.extract_from_s3("s3://bucket/products.csv")
+
+        pd.testing.assert_frame_equal(result_df, pd.read_csv(io.BytesIO(data)))
+        self.assertIn("Unnamed: 0", result_df.columns)
+        self.assertTrue(result_df.loc[1, ["product_name", "date_added"]].isna().all())
+        self.assertIsInstance(result_df.loc[0, "date_added"], str)
 
     @patch("main.data_extraction.DataCleaning.validate_and_clean_data")
     @patch("main.data_extraction.DataCleaning.get_valid_data")